@@ -1,17 +1,42 @@
 """The TimeTree integration."""
 import logging
+from datetime import timedelta
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, SupportsResponse
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, CONF_CALENDAR_ID
+from .const import (
+    DOMAIN,
+    CONF_CALENDAR_ID,
+    CONF_FAST_DECODE,
+    DEFAULT_FAST_DECODE,
+    SERVICE_FREE_BUSY,
+    ATTR_START,
+    ATTR_END,
+    ATTR_MIN_DURATION,
+    DEFAULT_MIN_DURATION,
+)
 from .api import TimeTreeApi
 from .coordinator import TimeTreeCoordinator
+from .freebusy import TimeTreeFreeBusy
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["calendar", "sensor"]
 
+FREE_BUSY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Required(ATTR_END): cv.datetime,
+        vol.Optional(
+            ATTR_MIN_DURATION, default=timedelta(minutes=DEFAULT_MIN_DURATION)
+        ): vol.All(cv.positive_time_period, vol.Range(min=timedelta(minutes=1))),
+    }
+)
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up TimeTree from a config entry."""
     hass.data.setdefault(DOMAIN, {})
@@ -21,7 +46,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     calendar_id = entry.data[CONF_CALENDAR_ID]
 
     # Initialize API
-    api = TimeTreeApi(hass, email, password)
+    api = TimeTreeApi(
+        hass, email, password, entry.options.get(CONF_FAST_DECODE, DEFAULT_FAST_DECODE)
+    )
     
     # Initialize Coordinator
     coordinator = TimeTreeCoordinator(hass, api, calendar_id, entry)
@@ -32,6 +59,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # The free/busy service spans every loaded calendar, so register it only once
+    if not hass.services.has_service(DOMAIN, SERVICE_FREE_BUSY):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_FREE_BUSY,
+            TimeTreeFreeBusy(hass).async_handle,
+            schema=FREE_BUSY_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
     
     # Register update listener for option changes (Scan Interval)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -46,5 +83,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_FREE_BUSY)
 
     return unload_ok
\ No newline at end of file
@@ -1,6 +1,8 @@
 """API Client for TimeTree."""
 import logging
 import uuid
+import time
+import zlib
 import requests
 import json
 from datetime import datetime, timedelta
@@ -8,6 +10,25 @@ from zoneinfo import ZoneInfo
 
 from homeassistant.core import HomeAssistant
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Same fallback order as urllib3, so every encoding it advertises can be decoded here
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 _LOGGER = logging.getLogger(__name__)
 
 API_BASEURI = "https://timetreeapp.com/api/v1"
@@ -19,12 +40,14 @@ class TimeTreeAuthError(Exception):
 class TimeTreeApi:
     """TimeTree API Client."""
 
-    def __init__(self, hass: HomeAssistant, email: str, password: str):
+    def __init__(self, hass: HomeAssistant, email: str, password: str, fast_decode: bool = True):
         self._hass = hass
         self._email = email
         self._password = password
+        self._fast_decode = fast_decode
         self._session_id = None
         self._session = requests.Session()
+        self.sync_stats = {}
 
     def _login(self):
         """Log in to TimeTree and get session ID."""
@@ -86,16 +109,65 @@ class TimeTreeApi:
         headers = {"X-Timetreea": API_USER_AGENT}
         
         _LOGGER.debug("Fetching chunked events since: %s", since)
-        response = self._session.get(url, headers=headers)
-        response.raise_for_status()
-        r_json = response.json()
+        response = self._session.get(url, headers=headers, stream=True)
+        with response:
+            response.raise_for_status()
+            r_json = self._decode_sync(response)
         
-        events = r_json.get("events", [])
-        if r_json.get("chunk") is True:
+        events = r_json["events"]
+        if r_json["chunk"] is True:
             events.extend(self._get_events_recur(calendar_id, r_json["since"]))
         
         return events
 
+    @staticmethod
+    def _decompress(body, encoding):
+        """Undo the Content-Encoding of a raw response body."""
+        if encoding in ("", "identity"):
+            return body
+        if encoding in ("gzip", "x-gzip"):
+            return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        if encoding == "br" and brotli is not None:
+            return brotli.decompress(body)
+        if encoding == "zstd" and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+
+    def _decode_sync(self, response):
+        """Decompress and decode a streamed sync chunk, recording transfer stats."""
+        # Read the body still compressed so its length is the real transfer size
+        try:
+            raw = response.raw.read(decode_content=False)
+        finally:
+            response.raw.release_conn()
+        encoding = response.headers.get("Content-Encoding", "identity").strip().lower()
+
+        started = time.perf_counter()
+        body = self._decompress(raw, encoding)
+        decompressed = time.perf_counter()
+        data = orjson.loads(body) if self._fast_decode and orjson else json.loads(body)
+        decode_ms = (time.perf_counter() - decompressed) * 1000
+        decompress_ms = (decompressed - started) * 1000
+
+        stats = self.sync_stats
+        stats["requests"] = stats.get("requests", 0) + 1
+        stats["bytes_on_wire"] = stats.get("bytes_on_wire", 0) + len(raw)
+        stats["bytes_decoded"] = stats.get("bytes_decoded", 0) + len(body)
+        stats["decompress_ms"] = round(stats.get("decompress_ms", 0) + decompress_ms, 3)
+        stats["decode_ms"] = round(stats.get("decode_ms", 0) + decode_ms, 3)
+        stats["content_encoding"] = encoding
+
+        return {
+            "events": data.get("events", []),
+            "chunk": data.get("chunk"),
+            "since": data.get("since"),
+        }
+
     def _get_events(self, calendar_id):
         """Fetch all events for a specific calendar."""
         if not self._session_id:
@@ -105,21 +177,34 @@ class TimeTreeApi:
         headers = {"X-Timetreea": API_USER_AGENT}
 
         _LOGGER.debug("Fetching events for calendar: %s", calendar_id)
-        response = self._session.get(url, headers=headers)
+        response = self._session.get(url, headers=headers, stream=True)
         
         if response.status_code == 401:
             _LOGGER.debug("Token expired during event fetch. Re-logging in.")
+            response.close()
             self._login()
-            response = self._session.get(url, headers=headers)
+            response = self._session.get(url, headers=headers, stream=True)
             
-        response.raise_for_status()
-        r_json = response.json()
+        self.sync_stats = {"decoder": "orjson" if self._fast_decode and orjson else "json"}
+        with response:
+            response.raise_for_status()
+            r_json = self._decode_sync(response)
         
-        events = r_json.get("events", [])
-        if r_json.get("chunk") is True:
+        events = r_json["events"]
+        if r_json["chunk"] is True:
             events.extend(self._get_events_recur(calendar_id, r_json["since"]))
             
         _LOGGER.debug("Fetched %s events.", len(events))
+        _LOGGER.debug(
+            "Sync transfer: %s bytes on wire (%s, decompressed in %s ms), %s bytes decoded in %s ms with %s over %s request(s).",
+            self.sync_stats["bytes_on_wire"],
+            self.sync_stats["content_encoding"],
+            self.sync_stats["decompress_ms"],
+            self.sync_stats["bytes_decoded"],
+            self.sync_stats["decode_ms"],
+            self.sync_stats["decoder"],
+            self.sync_stats["requests"],
+        )
         return events
 
     def _create_event(self, calendar_id, event_data):
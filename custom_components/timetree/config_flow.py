@@ -13,7 +13,9 @@ from .const import (
     CONF_CALENDAR_ID, 
     CONF_CALENDAR_NAME, 
     CONF_SCAN_INTERVAL,
+    CONF_FAST_DECODE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_FAST_DECODE,
     MIN_SCAN_INTERVAL,
     MAX_SCAN_INTERVAL
 )
@@ -146,6 +148,9 @@ class TimeTreeOptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_SCAN_INTERVAL, 
                 self._config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
             )
+            current_fast_decode = self._config_entry.options.get(
+                CONF_FAST_DECODE, DEFAULT_FAST_DECODE
+            )
 
             schema = vol.Schema({
                 vol.Required(CONF_SCAN_INTERVAL, default=current_interval): selector.NumberSelector(
@@ -155,7 +160,8 @@ class TimeTreeOptionsFlowHandler(config_entries.OptionsFlow):
                         step=1, 
                         mode=selector.NumberSelectorMode.SLIDER
                     )
-                )
+                ),
+                vol.Required(CONF_FAST_DECODE, default=current_fast_decode): selector.BooleanSelector(),
             })
 
             return self.async_show_form(step_id="init", data_schema=schema)
@@ -4,9 +4,17 @@ DOMAIN = "timetree"
 CONF_CALENDAR_ID = "calendar_id"
 CONF_CALENDAR_NAME = "calendar_name"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_FAST_DECODE = "fast_decode"
 
 DEFAULT_SCAN_INTERVAL = 60
 MIN_SCAN_INTERVAL = 5
 MAX_SCAN_INTERVAL = 120
+DEFAULT_FAST_DECODE = True
+
+SERVICE_FREE_BUSY = "free_busy"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_MIN_DURATION = "min_duration"
+DEFAULT_MIN_DURATION = 30
 
 LOGGER_NAME = "custom_components.timetree"
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""Free/busy queries across all loaded TimeTree calendars."""
+from datetime import datetime, time, timedelta, timezone
+import logging
+
+from dateutil.rrule import rrulestr, rruleset
+
+from homeassistant.core import ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, ATTR_START, ATTR_END, ATTR_MIN_DURATION
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_CACHED_QUERIES = 32
+
+
+def _to_local_datetime(value):
+    """Return an aware datetime for an event boundary (all-day dates start at local midnight)."""
+    if isinstance(value, datetime):
+        return value
+    return dt_util.start_of_local_day(value)
+
+
+def _parse_ical_datetime(value, start, tzinfo):
+    """Parse an iCal DATE or DATE-TIME value into an aware datetime.
+
+    Dates take the wall-clock time of the first occurrence, naive values the
+    given zone, and values ending in Z are UTC.
+    """
+    value = value.strip()
+    if len(value) == 8:
+        day = datetime.strptime(value, "%Y%m%d").date()
+        return datetime.combine(day, start.time(), tzinfo=start.tzinfo)
+    if value.endswith("Z"):
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    return datetime.strptime(value, "%Y%m%dT%H%M%S").replace(tzinfo=tzinfo)
+
+
+def _split_property(line):
+    """Split 'NAME;PARAM=X:VALUE' into (name, params, value)."""
+    head, _, value = line.partition(":")
+    name, *params = head.split(";")
+    return name.upper(), dict(p.split("=", 1) for p in params if "=" in p), value
+
+
+def _build_ruleset(recurrences, start):
+    """Build an rruleset whose UNTIL/EXDATE/RDATE values all match the aware DTSTART."""
+    ruleset = rruleset()
+    # DTSTART is always an occurrence unless excluded; the set drops duplicates
+    ruleset.rdate(start)
+    for line in recurrences:
+        name, params, value = _split_property(line.strip())
+        tzinfo = start.tzinfo
+        if "TZID" in params:
+            tzinfo = dt_util.get_time_zone(params["TZID"]) or tzinfo
+
+        if name == "RRULE":
+            parts = []
+            for part in value.split(";"):
+                key, _, until = part.partition("=")
+                if key.upper() == "UNTIL" and not until.endswith("Z"):
+                    if len(until) == 8:
+                        # A date-only UNTIL includes that whole local day
+                        day = datetime.strptime(until, "%Y%m%d").date()
+                        bound = datetime.combine(day, time.max, tzinfo=start.tzinfo)
+                    else:
+                        bound = _parse_ical_datetime(until, start, start.tzinfo)
+                    part = f"UNTIL={bound.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
+                parts.append(part)
+            ruleset.rrule(rrulestr(";".join(parts), dtstart=start))
+        elif name in ("EXDATE", "RDATE"):
+            add = ruleset.exdate if name == "EXDATE" else ruleset.rdate
+            for item in value.split(","):
+                add(_parse_ical_datetime(item, start, tzinfo))
+        else:
+            raise ValueError(f"Unsupported recurrence property: {name}")
+    return ruleset
+
+
+def event_intervals(event, window_start, window_end):
+    """Yield (start_ts, end_ts) busy intervals of an event, expanding recurrences."""
+    start = _to_local_datetime(event["start"])
+    end = _to_local_datetime(event["end"])
+    all_day = not isinstance(event["start"], datetime)
+    # Absolute seconds, so a 23 h or 25 h DST day keeps its real length
+    duration = end.timestamp() - start.timestamp()
+    span_days = (event["end"] - event["start"]).days if all_day else 0
+    lo = window_start.timestamp()
+    hi = window_end.timestamp()
+
+    starts = [start]
+    recurrences = event.get("recurrences")
+    if recurrences:
+        try:
+            ruleset = _build_ruleset(recurrences, start)
+            # One hour of slack covers all-day occurrences that grow across a DST change
+            lookback = timedelta(seconds=duration) + timedelta(hours=1)
+            starts = ruleset.between(window_start - lookback, window_end, inc=True)
+        except (ValueError, TypeError) as err:
+            _LOGGER.warning(
+                "Cannot expand recurrence %s of event %s, only its first occurrence counts as busy: %s",
+                recurrences,
+                event.get("uid"),
+                err,
+            )
+
+    for occ_start in starts:
+        s = occ_start.timestamp()
+        if all_day:
+            # Each occurrence ends at local midnight, whatever the DST offset that day
+            e = dt_util.start_of_local_day(occ_start.date() + timedelta(days=span_days)).timestamp()
+        else:
+            e = s + duration
+        if s < hi and e > lo:
+            yield (max(s, lo), min(e, hi))
+
+
+def merge_intervals(intervals):
+    """Merge overlapping (start, end) intervals with a sweep over the sorted list."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def free_slots(busy, window_start, window_end, min_duration):
+    """Return (start_ts, end_ts) gaps of at least min_duration between merged busy intervals."""
+    min_seconds = min_duration.total_seconds()
+    cursor = window_start.timestamp()
+    slots = []
+    for start, end in busy:
+        if start > cursor and start - cursor >= min_seconds:
+            slots.append((cursor, start))
+        cursor = max(cursor, end)
+    hi = window_end.timestamp()
+    if hi > cursor and hi - cursor >= min_seconds:
+        slots.append((cursor, hi))
+    return slots
+
+
+class TimeTreeFreeBusy:
+    """Service handler for timetree.free_busy with a refresh-aware result cache."""
+
+    def __init__(self, hass):
+        """Initialize."""
+        self._hass = hass
+        self._generation = None
+        self._cache = {}
+
+    def _coordinators(self):
+        return [c for c in self._hass.data.get(DOMAIN, {}).values() if c.data is not None]
+
+    async def async_handle(self, call: ServiceCall):
+        """Return free slots common to all loaded TimeTree calendars."""
+        window_start = call.data[ATTR_START]
+        window_end = call.data[ATTR_END]
+        min_duration = call.data[ATTR_MIN_DURATION]
+        if window_start.tzinfo is None:
+            window_start = window_start.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        if window_end.tzinfo is None:
+            window_end = window_end.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        if window_end <= window_start:
+            raise ServiceValidationError("End must be after start")
+
+        coordinators = self._coordinators()
+
+        # Any refresh of a contributing calendar changes its timestamp and drops the cache
+        generation = tuple(
+            (c.calendar_id, c.last_update_success_time) for c in coordinators
+        )
+        if generation != self._generation or len(self._cache) >= MAX_CACHED_QUERIES:
+            self._generation = generation
+            self._cache = {}
+
+        # Bind the cache first so a reset during the await cannot receive a stale result
+        cache = self._cache
+        key = (window_start.timestamp(), window_end.timestamp(), min_duration)
+        if key not in cache:
+            cache[key] = await self._hass.async_add_executor_job(
+                self._compute, coordinators, window_start, window_end, min_duration
+            )
+        busy, free = cache[key]
+
+        # Only epoch seconds are cached; format in the caller's own offset
+        tz = window_start.tzinfo
+
+        def _slot(start, end):
+            return {
+                "start": datetime.fromtimestamp(start, tz).isoformat(),
+                "end": datetime.fromtimestamp(end, tz).isoformat(),
+                "duration_minutes": int((end - start) // 60),
+            }
+
+        return {
+            "calendars": [c.calendar_id for c in coordinators],
+            "busy": [_slot(s, e) for s, e in busy],
+            "free": [_slot(s, e) for s, e in free],
+        }
+
+    @staticmethod
+    def _compute(coordinators, window_start, window_end, min_duration):
+        intervals = [
+            interval
+            for coordinator in coordinators
+            for event in coordinator.data
+            for interval in event_intervals(event, window_start, window_end)
+        ]
+        busy = merge_intervals(intervals)
+        return busy, free_slots(busy, window_start, window_end, min_duration)
@@ -22,6 +22,9 @@ class TimeTreeLastUpdatedSensor(SensorEntity):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:clock-check-outline"
+    _unrecorded_attributes = frozenset(
+        {"requests", "bytes_on_wire", "bytes_decoded", "decompress_ms", "decode_ms"}
+    )
 
     def __init__(self, coordinator: TimeTreeCoordinator, calendar_name: str):
         """Initialize the sensor."""
@@ -34,6 +37,11 @@ class TimeTreeLastUpdatedSensor(SensorEntity):
         """Return the state of the sensor."""
         return self.coordinator.last_update_success_time
 
+    @property
+    def extra_state_attributes(self):
+        """Return transfer and decode stats of the last sync."""
+        return dict(self.coordinator.api.sync_stats)
+
     @property
     def available(self):
         """Return if entity is available."""
@@ -0,0 +1,177 @@
+"""Tests for the TimeTree free/busy engine."""
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.timetree.freebusy import (
+    _build_ruleset,
+    _parse_ical_datetime,
+    event_intervals,
+    free_slots,
+    merge_intervals,
+)
+
+TZ = ZoneInfo("Europe/Berlin")
+
+
+@pytest.fixture(autouse=True)
+def berlin_time_zone():
+    """Run every test in a zone with a DST change on 2025-03-30."""
+    previous = dt_util.DEFAULT_TIME_ZONE
+    dt_util.set_default_time_zone(TZ)
+    yield
+    dt_util.set_default_time_zone(previous)
+
+
+def local(*args):
+    return datetime(*args, tzinfo=TZ)
+
+
+def busy(event, window_start, window_end):
+    """Return merged busy intervals of one event as local datetimes."""
+    return [
+        (datetime.fromtimestamp(s, TZ), datetime.fromtimestamp(e, TZ))
+        for s, e in merge_intervals(event_intervals(event, window_start, window_end))
+    ]
+
+
+def test_parse_ical_datetime_forms():
+    start = local(2025, 3, 29, 9)
+    assert _parse_ical_datetime("20250401", start, TZ) == local(2025, 4, 1, 9)
+    assert _parse_ical_datetime("20250401T080000Z", start, TZ) == datetime(
+        2025, 4, 1, 8, tzinfo=timezone.utc
+    )
+    assert _parse_ical_datetime("20250401T080000", start, TZ) == local(2025, 4, 1, 8)
+
+
+def test_ruleset_date_only_until_includes_last_day():
+    start = dt_util.start_of_local_day(date(2025, 3, 29))
+    ruleset = _build_ruleset(["RRULE:FREQ=DAILY;UNTIL=20250331"], start)
+    assert [d.date() for d in ruleset] == [
+        date(2025, 3, 29),
+        date(2025, 3, 30),
+        date(2025, 3, 31),
+    ]
+
+
+def test_ruleset_exdate_removes_dtstart():
+    start = dt_util.start_of_local_day(date(2025, 3, 29))
+    ruleset = _build_ruleset(
+        ["RRULE:FREQ=DAILY;COUNT=3", "EXDATE;VALUE=DATE:20250329"], start
+    )
+    assert [d.date() for d in ruleset] == [date(2025, 3, 30), date(2025, 3, 31)]
+
+
+def test_ruleset_adds_dtstart_once():
+    # DTSTART is a Saturday, the rule only yields Mondays
+    start = local(2025, 3, 29, 9)
+    ruleset = _build_ruleset(["RRULE:FREQ=WEEKLY;BYDAY=MO;COUNT=1"], start)
+    assert list(ruleset) == [start, local(2025, 3, 31, 9)]
+
+    ruleset = _build_ruleset(["RRULE:FREQ=DAILY;COUNT=2"], start)
+    assert list(ruleset) == [start, local(2025, 3, 30, 9)]
+
+
+def test_ruleset_tzid_exdate():
+    start = local(2025, 3, 29, 9)
+    ruleset = _build_ruleset(
+        ["RRULE:FREQ=DAILY;COUNT=3", "EXDATE;TZID=Europe/London:20250330T080000"],
+        start,
+    )
+    assert list(ruleset) == [start, local(2025, 3, 31, 9)]
+
+
+def test_all_day_recurrence_across_dst():
+    event = {
+        "start": date(2025, 3, 29),
+        "end": date(2025, 3, 30),
+        "recurrences": ["RRULE:FREQ=DAILY;UNTIL=20250331", "EXDATE;VALUE=DATE:20250329"],
+    }
+    # 2025-03-30 is only 23 hours long; the block must still end at local midnight
+    assert busy(event, local(2025, 3, 28), local(2025, 4, 2)) == [
+        (local(2025, 3, 30), local(2025, 4, 1)),
+    ]
+
+
+def test_single_all_day_event_on_dst_day():
+    event = {"start": date(2025, 3, 30), "end": date(2025, 3, 31), "recurrences": None}
+    assert busy(event, local(2025, 3, 29), local(2025, 4, 1)) == [
+        (local(2025, 3, 30), local(2025, 3, 31)),
+    ]
+
+
+def test_timed_recurrence_keeps_wall_clock_across_dst():
+    event = {
+        "start": local(2025, 3, 29, 9),
+        "end": local(2025, 3, 29, 10),
+        "recurrences": ["RRULE:FREQ=DAILY;UNTIL=20250331T235959Z", "EXDATE:20250330T090000"],
+    }
+    assert busy(event, local(2025, 3, 28), local(2025, 4, 2)) == [
+        (local(2025, 3, 29, 9), local(2025, 3, 29, 10)),
+        (local(2025, 3, 31, 9), local(2025, 3, 31, 10)),
+    ]
+
+
+def test_occurrence_before_window_is_clipped():
+    event = {
+        "start": local(2025, 3, 31, 23),
+        "end": local(2025, 4, 1, 2),
+        "recurrences": ["RRULE:FREQ=DAILY"],
+    }
+    assert busy(event, local(2025, 4, 2), local(2025, 4, 2, 12)) == [
+        (local(2025, 4, 2), local(2025, 4, 2, 2)),
+    ]
+
+
+def test_unparseable_recurrence_warns_and_keeps_first_occurrence(caplog):
+    event = {
+        "uid": "abc",
+        "start": local(2025, 3, 29, 9),
+        "end": local(2025, 3, 29, 10),
+        "recurrences": ["FOO:bar"],
+    }
+    assert busy(event, local(2025, 3, 28), local(2025, 4, 2)) == [
+        (local(2025, 3, 29, 9), local(2025, 3, 29, 10)),
+    ]
+    assert "Cannot expand recurrence" in caplog.text
+    assert caplog.records[0].levelname == "WARNING"
+
+
+def test_merge_intervals():
+    assert merge_intervals([(5, 6), (1, 3), (2, 4), (4, 4.5), (7, 8)]) == [
+        [1, 4.5],
+        [5, 6],
+        [7, 8],
+    ]
+    assert merge_intervals([(1, 10), (2, 3)]) == [[1, 10]]
+    assert merge_intervals([]) == []
+
+
+def test_free_slots_respects_min_duration():
+    ws = local(2025, 4, 1, 8)
+    we = local(2025, 4, 1, 18)
+    hour = 3600
+    base = ws.timestamp()
+    merged = [[base + hour, base + 2 * hour], [base + 2.25 * hour, base + 9 * hour]]
+    assert free_slots(merged, ws, we, timedelta(minutes=30)) == [
+        (base, base + hour),
+        (base + 9 * hour, we.timestamp()),
+    ]
+    assert free_slots(merged, ws, we, timedelta(minutes=10)) == [
+        (base, base + hour),
+        (base + 2 * hour, base + 2.25 * hour),
+        (base + 9 * hour, we.timestamp()),
+    ]
+
+
+def test_free_slots_never_returns_empty_gaps():
+    ws = local(2025, 4, 1, 8)
+    we = local(2025, 4, 1, 18)
+    merged = [[ws.timestamp(), ws.timestamp() + 3600], [we.timestamp() - 3600, we.timestamp()]]
+    assert free_slots(merged, ws, we, timedelta(0)) == [
+        (ws.timestamp() + 3600, we.timestamp() - 3600),
+    ]
+    assert free_slots([[ws.timestamp(), we.timestamp()]], ws, we, timedelta(0)) == []